@@ -1,17 +1,32 @@
 #!/usr/bin/env python3
 import os
+import concurrent.futures
+import functools
+import hashlib
+import math
 import warnings
 import re
+import time
 import unicodedata
 
 # Suppress GTK deprecation warnings (StatusIcon is deprecated but still functional)
 warnings.filterwarnings("ignore", ".*is deprecated", DeprecationWarning)
 
+import cairo
 import gi
-import glob
 import json
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gdk, GLib, Pango
+from gi.repository import Gtk, Gdk, Gio, GLib, GObject, Pango
+
+# Use orjson for the session/index files when available (encodes straight to bytes)
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    _json_loads = json.loads
 
 # Try to import system tray support
 HAS_INDICATOR = False
@@ -30,16 +45,17 @@ except (ImportError, ValueError):
         pass
 
 # Icon fallback system for OS compatibility
+@functools.lru_cache(maxsize=None)
 def get_available_icon(icon_names):
-    """Try multiple icon names and return the first available one"""
+    """Try multiple icon names and return the first available one (cached per tuple)"""
     icon_theme = Gtk.IconTheme.get_default()
     for icon_name in icon_names:
         if icon_theme.has_icon(icon_name):
             return icon_name
     return icon_names[-1]  # Fallback to last option
 
-# Icon constants with fallbacks
-APP_ICON_NAMES = [
+# Icon constants with fallbacks (tuples so icon lookups can be cached)
+APP_ICON_NAMES = (
     "accessories-text-editor",
     "text-editor",
     "text-x-generic",
@@ -48,41 +64,60 @@ APP_ICON_NAMES = [
     "sticky-notes",
     "text-x-script",
     "application-default-icon"
-]
+)
 
-MENU_ICON_NAMES = [
+MENU_ICON_NAMES = (
     "open-menu-symbolic",
     "view-more-symbolic",
     "hamburger-menu",
     "application-menu",
     "preferences-system",
     "view-more"
-]
+)
 
-ZOOM_IN_ICONS = [
+ZOOM_IN_ICONS = (
     "zoom-in-symbolic",
     "zoom-in",
     "list-add-symbolic",
     "add",
     "gtk-zoom-in"
-]
+)
 
-ZOOM_OUT_ICONS = [
+ZOOM_OUT_ICONS = (
     "zoom-out-symbolic",
     "zoom-out",
     "list-remove-symbolic",
     "remove",
     "gtk-zoom-out"
-]
+)
 
 # Global variables
 windows = []
 open_notes = {}
 manager_instance = None
 tray_icon = None
+# Tray popup menu, built once and reused on every right-click
+_TRAY_MENU = None
+refresh_pending = False
 data_dir = os.path.expanduser("~/.sticky_notes")
 os.makedirs(data_dir, exist_ok=True)
 session_file = os.path.join(data_dir, "session.json")
+# Digest of the session payload last read or written, to skip identical writes
+_last_session_hash = None
+index_file = os.path.join(data_dir, "index.json")
+# In-memory note index, loaded lazily. One entry per note:
+#   {note_id: {"color", "title", "mtime", "zoom", "x", "y", "width", "height"}}
+# plus "_next_id". "mtime" is the st_mtime of the note's text.md, which stays
+# a plain markdown file per note.
+note_index = None
+# Data directory mtime the index was last reconciled against
+index_dir_mtime = None
+# Pending index write; bursts of updates are written at most every 250 ms
+index_save_id = None
+# Whether the in-memory index has changes not yet written to index.json
+index_dirty = False
+# Note files are written on one background thread, in submission order
+_save_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
 # Very light/whitish pastel colors
 DEFAULT_COLORS = [
@@ -96,11 +131,67 @@ DEFAULT_COLORS = [
     "#FFF8FC",  # Very light rose
 ]
 
+# Full circle in radians for cairo arcs
+_TAU = math.tau
+# Parsed (red, green, blue, alpha) tuples keyed by color string
+_RGBA_CACHE = {}
+# Pre-rendered color indicator circles keyed by (color, scale factor)
+_CIRCLE_SURFACE_CACHE = {}
+# Character display widths in half columns, filled in as characters are seen
+_CHAR_HALF_WIDTHS = {}
+# Shared note CSS providers: background keyed by color, font size by zoom level
+_COLOR_CSS_CACHE = {}
+_FONT_CSS_CACHE = {}
+# Enum values used when building widgets, looked up once
+_ELLIPSIZE_END = Pango.EllipsizeMode.END
+_ICON_SIZE_BUTTON = Gtk.IconSize.BUTTON
+_CONTROL_MASK = Gdk.ModifierType.CONTROL_MASK
+# Ctrl+key zoom shortcuts: keyval -> StickyNote method name
+_ZOOM_KEYS = {
+    Gdk.KEY_plus: "zoom_in",
+    Gdk.KEY_equal: "zoom_in",
+    Gdk.KEY_minus: "zoom_out",
+    Gdk.KEY_0: "reset_zoom",
+}
+
+# Inline markdown: **bold** (group 1) or *italic* (group 2)
+_INLINE_RE = re.compile(r'\*\*(.+?)\*\*|\*([^*]+)\*')
+# Preview line kinds in one match: a table row (same test as
+# TableParser.is_table_line) or a "# "/"## " header with its text
+_LINE_RE = re.compile(r'(?P<table>\s*\|.*\|\s*$)|#{1,2} (?P<header>.*)$', re.DOTALL)
+# Table separator row (cells blank or a dash run with optional colons)
+_SEP_LINE_RE = re.compile(r'^\|(?:\s*(?::?-+:?\s*)?\|)+$')
+# Bold/italic markers stripped when measuring table cells
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITAL_RE = re.compile(r'\*([^*]+)\*')
+
+def parse_rgba(color):
+    """Return (red, green, blue, alpha) for a color string, parsing each color once"""
+    rgba_tuple = _RGBA_CACHE.get(color)
+    if rgba_tuple is None:
+        rgba = Gdk.RGBA()
+        rgba.parse(color)
+        rgba_tuple = (rgba.red, rgba.green, rgba.blue, rgba.alpha)
+        _RGBA_CACHE[color] = rgba_tuple
+    return rgba_tuple
+
 def refresh_manager():
     """Refresh the notes manager if it exists and is visible"""
-    global manager_instance
+    global manager_instance, refresh_pending
+    if manager_instance:
+        # A hidden manager reloads the next time it is shown
+        manager_instance._notes_dirty = True
+    if manager_instance and manager_instance.get_visible() and not refresh_pending:
+        # Collapse bursts (e.g. destroy + open) into a single reload
+        refresh_pending = True
+        GLib.idle_add(run_pending_refresh)
+
+def run_pending_refresh():
+    global refresh_pending
+    refresh_pending = False
     if manager_instance and manager_instance.get_visible():
         manager_instance.load_notes()
+    return False
 
 def on_window_destroy(window):
     global windows
@@ -108,8 +199,9 @@ def on_window_destroy(window):
         windows.remove(window)
     if isinstance(window, StickyNote) and window.note_id in open_notes:
         del open_notes[window.note_id]
-    # Refresh manager when a note window is closed
-    refresh_manager()
+        # Only the closed note's status indicator changes
+        if manager_instance:
+            manager_instance.mark_open(window.note_id, False)
     # Don't quit if we have system tray or manager
     if not windows and not tray_icon and not manager_instance:
         save_session()
@@ -117,7 +209,62 @@ def on_window_destroy(window):
     elif not windows:
         save_session()
 
+def _atomic_write_bytes(path, data):
+    """Write data to a temp file with os.write, then rename it over path"""
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+def _write_data_file(path, data):
+    """Atomically write one of the app's own files in data_dir (index, session)"""
+    global index_dir_mtime
+    # The temp file and rename change data_dir's mtime; if the index was in
+    # sync before, it still is, so keep load_notes from rescanning every note
+    try:
+        in_sync = os.stat(data_dir).st_mtime_ns == index_dir_mtime
+    except OSError:
+        in_sync = False
+    _atomic_write_bytes(path, data)
+    if in_sync:
+        try:
+            index_dir_mtime = os.stat(data_dir).st_mtime_ns
+        except OSError:
+            pass
+
+def _write_note(note_dir, note_path, text, ensure_dir):
+    """Write a note file (runs on the save thread) and return its new mtime"""
+    if ensure_dir:
+        os.makedirs(note_dir, exist_ok=True)
+    # Write to a temp file and rename so a crash never leaves a truncated note
+    _atomic_write_bytes(note_path, text.encode('utf-8'))
+    return os.stat(note_path).st_mtime
+
+def _fsync_dir(path):
+    """Flush a directory's entries (e.g. renamed-in files) to disk"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def wait_for_pending_saves():
+    """Block until every note write queued on the save thread has finished"""
+    # The single worker runs tasks in order, so a no-op task finishes last
+    _save_executor.submit(int).result()
+
 def save_session():
+    global _last_session_hash
     session_data = []
     for window in windows:
         if isinstance(window, StickyNote):
@@ -132,20 +279,244 @@ def save_session():
                 "is_edit_mode": window.is_edit_mode,
                 "zoom_level": window.zoom_level
             })
-    with open(session_file, 'w') as f:
-        json.dump(session_data, f)
+    payload = _json_dumps(session_data)
+    new_hash = hashlib.blake2b(payload, digest_size=16).digest()
+    if new_hash == _last_session_hash:
+        return
+    # Write atomically so an interrupted save never truncates the session
+    _write_data_file(session_file, payload)
+    _last_session_hash = new_hash
 
 def load_session():
-    if not os.path.exists(session_file):
+    global _last_session_hash
+    try:
+        with open(session_file, 'rb') as f:
+            payload = f.read()
+    except:
         return []
+    _last_session_hash = hashlib.blake2b(payload, digest_size=16).digest()
     try:
-        with open(session_file, 'r') as f:
-            return json.load(f)
+        return _json_loads(payload)
     except:
         return []
 
+def load_index():
+    """Return the note index, reading index.json on first use"""
+    global note_index
+    if note_index is None:
+        try:
+            with open(index_file, 'rb') as f:
+                note_index = _json_loads(f.read())
+        except:
+            note_index = {}
+    return note_index
+
+def save_index():
+    """Schedule an index write, coalescing bursts of updates into one"""
+    global index_save_id, index_dirty
+    index_dirty = True
+    if index_save_id is None:
+        index_save_id = GLib.timeout_add(250, on_index_save_timer)
+
+def on_index_save_timer():
+    global index_save_id
+    index_save_id = None
+    flush_index()
+    return False
+
+def flush_index():
+    """Write the note index atomically now if it has unsaved changes"""
+    global index_save_id, index_dirty
+    if index_save_id is not None:
+        GLib.source_remove(index_save_id)
+        index_save_id = None
+    if not index_dirty:
+        return True
+    try:
+        _write_data_file(index_file, _json_dumps(load_index()))
+    except:
+        return False
+    index_dirty = False
+    return True
+
+def _read_small(path, n=64):
+    """Read a tiny text file with one os.read, skipping the buffered io stack"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, n).decode('ascii', 'replace').strip()
+    finally:
+        os.close(fd)
+
+def _read_text(path):
+    """Read a whole UTF-8 text file with one os.read sized by fstat"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    text = data.decode('utf-8')
+    # Same newlines as a text-mode read
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _read_first_line(path, n=256):
+    """Return (title, mtime) of a note file using one bounded os.read"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        mtime = os.fstat(fd).st_mtime
+        data = os.read(fd, n)
+    finally:
+        os.close(fd)
+    nl = data.find(b'\n')
+    if nl >= 0:
+        title = data[:nl].decode('utf-8', 'replace')
+    else:
+        # Whole read is one line; drop a multi-byte character cut off at the end
+        title = data.decode('utf-8', 'ignore')
+    return title.strip() or "Untitled", mtime
+
+def read_note_meta(note_dir):
+    """Read title, mtime and color from a note's files, or None if it has no text.md"""
+    try:
+        title, mtime = _read_first_line(note_dir + os.sep + "text.md")
+    except FileNotFoundError:
+        return None
+    except OSError:
+        title, mtime = "Untitled", 0
+    # Legacy per-note color file
+    try:
+        color = _read_small(note_dir + os.sep + "color.txt")
+    except OSError:
+        color = DEFAULT_COLORS[0]
+    return {"color": color, "title": title, "mtime": mtime}
+
+def sync_index():
+    """Reconcile the index with the note folders on disk"""
+    global index_dir_mtime
+    index = load_index()
+    # Scan for note folders (DirEntry caches type and stat info)
+    with os.scandir(data_dir) as it:
+        entries = {e.name: e for e in it if e.name.startswith("note") and e.is_dir(follow_symlinks=False)}
+    changed = False
+    # Drop notes whose folder is gone
+    for note_id in [n for n in index if not n.startswith("_") and n not in entries]:
+        del index[note_id]
+        changed = True
+    sep = os.sep
+    for note_id, entry in entries.items():
+        meta = index.get(note_id)
+        if meta is not None:
+            # One stat tells whether text.md changed since it was indexed
+            try:
+                mtime = os.stat(entry.path + sep + "text.md").st_mtime
+            except FileNotFoundError:
+                del index[note_id]
+                changed = True
+                continue
+            except OSError:
+                continue
+            if meta.get("mtime") == mtime:
+                continue
+        # New note, note edited outside the app, or no index yet
+        fresh = read_note_meta(entry.path)
+        if fresh is None:
+            continue
+        if meta is None:
+            index[note_id] = fresh
+        else:
+            meta["title"] = fresh["title"]
+            meta["mtime"] = fresh["mtime"]
+        changed = True
+    if changed:
+        save_index()
+    try:
+        index_dir_mtime = os.stat(data_dir).st_mtime_ns
+    except OSError:
+        index_dir_mtime = None
+
+def migrate_note_settings(note_id, entry):
+    """Fold a note's legacy color.txt, zoom.txt and dimensions.json into its
+    index entry and return the paths of the files whose values it now holds"""
+    note_dir = os.path.join(data_dir, note_id)
+    migrated = []
+    color_path = os.path.join(note_dir, "color.txt")
+    if "color" not in entry:
+        try:
+            entry["color"] = _read_small(color_path)
+        except OSError:
+            pass
+    if "color" in entry:
+        migrated.append(color_path)
+    zoom_path = os.path.join(note_dir, "zoom.txt")
+    try:
+        entry["zoom"] = float(_read_small(zoom_path))
+        migrated.append(zoom_path)
+    except:
+        entry["zoom"] = 1.0
+    dimensions_path = os.path.join(note_dir, "dimensions.json")
+    try:
+        with open(dimensions_path, 'rb') as f:
+            dimensions = _json_loads(f.read())
+        for key in ("x", "y", "width", "height"):
+            if key in dimensions:
+                entry[key] = dimensions[key]
+        migrated.append(dimensions_path)
+    except:
+        pass
+    save_index()
+    return migrated
+
+def remove_legacy_settings(paths):
+    """Persist the index, then remove legacy settings files it now holds"""
+    # Only unlink once the settings the files held are safely in index.json
+    if not paths or not flush_index():
+        return
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+def get_note_meta(note_id):
+    """Return the index entry for a note (empty if the note is unknown)"""
+    entry = load_index().get(note_id)
+    if entry is None:
+        sync_index()
+        entry = load_index().get(note_id, {})
+    if entry and "zoom" not in entry:
+        remove_legacy_settings(migrate_note_settings(note_id, entry))
+    return entry
+
+def preload_note_meta():
+    """Reconcile the index once and migrate legacy settings for every note"""
+    sync_index()
+    index = load_index()
+    migrated = []
+    for note_id, entry in list(index.items()):
+        if not note_id.startswith("_") and "zoom" not in entry:
+            migrated.extend(migrate_note_settings(note_id, entry))
+    # One index write for the whole batch instead of one per note
+    remove_legacy_settings(migrated)
+    return index
+
+def update_note_meta(note_id, **fields):
+    """Update fields of a note's index entry and persist the index"""
+    load_index().setdefault(note_id, {}).update(fields)
+    save_index()
+
+# Signal handlers shared by the tray, manager and note menus
+def _act_new(widget):
+    create_new_note()
+
+def _act_show(widget):
+    show_manager()
+
+def _act_exit(widget):
+    exit_app()
+
 def create_system_tray():
-    global tray_icon
+    global tray_icon, _TRAY_MENU
     app_icon = get_available_icon(APP_ICON_NAMES)
     if HAS_INDICATOR:
         # Use AppIndicator3 (Unity, some GNOME)
@@ -155,8 +526,8 @@ def create_system_tray():
             appindicator.IndicatorCategory.APPLICATION_STATUS
         )
         tray_icon.set_status(appindicator.IndicatorStatus.ACTIVE)
-        menu = create_tray_menu()
-        tray_icon.set_menu(menu)
+        _TRAY_MENU = create_tray_menu()
+        tray_icon.set_menu(_TRAY_MENU)
     elif HAS_STATUS_ICON:
         # Use older StatusIcon (works on XFCE, MATE, etc.)
         # Suppress deprecation warnings for this block
@@ -165,60 +536,62 @@ def create_system_tray():
             tray_icon = Gtk.StatusIcon()
             tray_icon.set_from_icon_name(app_icon)
             tray_icon.set_tooltip_text("Sticky Notes")
+            _TRAY_MENU = create_tray_menu()
             tray_icon.connect("popup-menu", on_status_icon_popup)
-            tray_icon.connect("activate", lambda x: show_manager())
+            tray_icon.connect("activate", _act_show)
     return tray_icon
 
 def create_tray_menu():
     menu = Gtk.Menu()
     # New note
     new_item = Gtk.MenuItem(label="New Note")
-    new_item.connect("activate", lambda x: create_new_note())
+    new_item.connect("activate", _act_new)
     menu.append(new_item)
     # Show all notes
     show_all_item = Gtk.MenuItem(label="Show All Notes")
-    show_all_item.connect("activate", lambda x: show_manager())
+    show_all_item.connect("activate", _act_show)
     menu.append(show_all_item)
     # Separator
     menu.append(Gtk.SeparatorMenuItem())
     # Exit
     exit_item = Gtk.MenuItem(label="Exit")
-    exit_item.connect("activate", lambda x: exit_app())
+    exit_item.connect("activate", _act_exit)
     menu.append(exit_item)
     menu.show_all()
     return menu
 
 def on_status_icon_popup(status_icon, button, activate_time):
-    menu = create_tray_menu()
-    menu.popup(None, None, Gtk.StatusIcon.position_menu, status_icon, button, activate_time)
+    _TRAY_MENU.popup(None, None, Gtk.StatusIcon.position_menu, status_icon, button, activate_time)
 
 def create_new_note():
-    # Find next available note ID
-    existing = []
-    for d in os.listdir(data_dir):
-        if os.path.isdir(os.path.join(data_dir, d)) and d.startswith("note"):
-            try:
-                num = int(d[4:])
-                existing.append(num)
-            except ValueError:
-                continue
-    next_id = max(existing) + 1 if existing else 1
+    # Find next available note ID (tracked in the index)
+    index = load_index()
+    next_id = index.get("_next_id")
+    if next_id is None:
+        # Seed from the note folders on disk the first time
+        next_id = 1
+        with os.scandir(data_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("note") and name[4:].isdecimal() and entry.is_dir(follow_symlinks=False):
+                    num = int(name[4:])
+                    if num >= next_id:
+                        next_id = num + 1
+    # Never reuse a folder that appeared outside the app
+    while os.path.exists(os.path.join(data_dir, f"note{next_id}")):
+        next_id += 1
     note_id = f"note{next_id}"
+    # Persisted together with the new note's entry below
+    index["_next_id"] = next_id + 1
     # Create note folder
     note_dir = os.path.join(data_dir, note_id)
     os.makedirs(note_dir, exist_ok=True)
     # Create default content
     note_path = os.path.join(note_dir, "text.md")
-    with open(note_path, 'w') as f:
-        f.write("New Note\n\n")
-    # Save default color
-    color_path = os.path.join(note_dir, "color.txt")
-    with open(color_path, 'w') as f:
-        f.write(DEFAULT_COLORS[0])
-    # Save default zoom
-    zoom_path = os.path.join(note_dir, "zoom.txt")
-    with open(zoom_path, 'w') as f:
-        f.write("1.0")
+    _atomic_write_bytes(note_path, b"New Note\n\n")
+    # Register in the index with the default color and zoom
+    update_note_meta(note_id, color=DEFAULT_COLORS[0], title="New Note",
+                     mtime=os.stat(note_path).st_mtime, zoom=1.0)
     # Create and show the note in edit mode
     note = StickyNote(note_id)
     note.show_all()
@@ -227,8 +600,9 @@ def create_new_note():
     note.update_edit_button()
     note.text_view.grab_focus()
     
-    # Refresh manager
-    refresh_manager()
+    # Add just the new row to the manager instead of rebuilding the list
+    if manager_instance:
+        manager_instance.add_note_item(note_id)
 
 def show_manager():
     global manager_instance
@@ -237,20 +611,26 @@ def show_manager():
         manager_instance.show_all()
     else:
         manager_instance.present()
-    # Refresh when showing the manager
-    manager_instance.load_notes()
+    # Refresh when showing the manager, picking up notes edited outside the app
+    sync_index()
+    manager_instance.load_notes(force=True)
 
 def delete_note(note_id):
     # Close note window if open
     if note_id in open_notes:
         open_notes[note_id].destroy()
+    # Let in-flight saves finish so they cannot recreate the folder
+    wait_for_pending_saves()
     # Delete note files
     note_dir = os.path.join(data_dir, note_id)
     if os.path.exists(note_dir):
         import shutil
         shutil.rmtree(note_dir)
-    # Refresh manager
-    refresh_manager()
+    if load_index().pop(note_id, None) is not None:
+        save_index()
+    # Drop just the deleted note's row from the manager
+    if manager_instance:
+        manager_instance.remove_note_item(note_id)
 
 def exit_app():
     global tray_icon, manager_instance
@@ -258,7 +638,9 @@ def exit_app():
     # Save dimensions of all windows before exiting
     for window in windows:
         if isinstance(window, StickyNote):
-            window.save_window_dimensions()
+            window.flush_window_dimensions()
+            window.flush_zoom_level()
+    flush_index()
     if tray_icon:
         if HAS_STATUS_ICON and hasattr(tray_icon, 'set_visible'):
             tray_icon.set_visible(False)
@@ -268,6 +650,18 @@ def exit_app():
         manager_instance = None
     Gtk.main_quit()
 
+class NoteItem(GObject.GObject):
+    """List model item for one note shown in the manager"""
+    note_id = GObject.Property(type=str, default="")
+    title = GObject.Property(type=str, default="Untitled")
+    color = GObject.Property(type=str, default=DEFAULT_COLORS[0])
+    
+    def __init__(self, note_id, title, color):
+        super().__init__()
+        self.note_id = note_id
+        self.title = title
+        self.color = color
+
 class NoteManager(Gtk.Window):
     def __init__(self):
         super().__init__(title="Sticky Notes Manager")
@@ -281,8 +675,12 @@ class NoteManager(Gtk.Window):
         self.set_skip_pager_hint(True)
         # Sort preference
         self.sort_by_name = False
+        # Row widgets by note id, for updating a single row in place
+        self._rows_by_id = {}
         # Track if this is the first load
         self.first_load = True
+        # Set when titles, colors or modification times may have changed
+        self._notes_dirty = True
         # Main container
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
         self.add(box)
@@ -291,7 +689,7 @@ class NoteManager(Gtk.Window):
         box.pack_start(header_box, False, False, 0)
         # New Note button
         new_btn = Gtk.Button(label="New Note")
-        new_btn.connect("clicked", lambda x: create_new_note())
+        new_btn.connect("clicked", _act_new)
         header_box.pack_start(new_btn, True, True, 0)
         # Sort button
         self.sort_btn = Gtk.Button(label="Sort: Date")
@@ -300,11 +698,14 @@ class NoteManager(Gtk.Window):
         # Hide to tray button (if tray is available)
         if tray_icon:
             hide_btn = Gtk.Button(label="Hide to Tray")
-            hide_btn.connect("clicked", lambda x: self.hide())
+            hide_btn.connect("clicked", self.on_hide_clicked)
             header_box.pack_start(hide_btn, False, False, 0)
         # List of notes
         scrolled = Gtk.ScrolledWindow()
         self.listbox = Gtk.ListBox()
+        # Rows are built from the model by _create_row
+        self.store = Gio.ListStore.new(NoteItem)
+        self.listbox.bind_model(self.store, self._create_row)
         scrolled.add(self.listbox)
         box.pack_start(scrolled, True, True, 0)
         # Status bar
@@ -324,13 +725,16 @@ class NoteManager(Gtk.Window):
         self.load_notes()
     
     def on_show(self, widget):
-        """Called when window is shown - ensures notes are loaded"""
+        """Called when window is shown - reloads notes that changed while hidden"""
         # Small delay to ensure window is fully realized
         GLib.idle_add(self.load_notes)
     
     def on_delete_event(self, widget, event):
         return False  # Allow destruction
     
+    def on_hide_clicked(self, button):
+        self.hide()
+    
     def on_manager_destroy(self, widget):
         global manager_instance
         manager_instance = None
@@ -360,15 +764,7 @@ class NoteManager(Gtk.Window):
     
     def confirm_delete(self, note_id):
         # Get note title for confirmation
-        note_path = os.path.join(data_dir, note_id, "text.md")
-        title = "Untitled"
-        if os.path.exists(note_path):
-            try:
-                with open(note_path, 'r') as f:
-                    first_line = f.readline().strip()
-                    title = first_line if first_line else "Untitled"
-            except:
-                pass
+        title = get_note_meta(note_id).get("title", "Untitled")
         # Updated MessageDialog constructor to avoid deprecation warnings
         dialog = Gtk.MessageDialog(
             parent=self,
@@ -395,8 +791,8 @@ class NoteManager(Gtk.Window):
             # Create new note window
             note = StickyNote(note_id)
             note.show_all()
-        # Refresh manager to show updated status
-        self.load_notes()
+        # Only this note's status indicator changes
+        self.mark_open(note_id, True)
     
     def toggle_sort(self, button):
         self.sort_by_name = not self.sort_by_name
@@ -404,99 +800,138 @@ class NoteManager(Gtk.Window):
             self.sort_btn.set_label("Sort: Name")
         else:
             self.sort_btn.set_label("Sort: Date")
-        self.load_notes()
+        self.load_notes(force=True)
     
-    def load_notes(self):
+    def load_notes(self, force=False):
         # Always load on first time, or only if visible after that
         if not self.first_load and not self.get_visible():
             return
+        # Nothing to do if no note changed since the last load
+        if not self._notes_dirty and not force:
+            return
         self.first_load = False
+        self._notes_dirty = False
         # Remember current selection
         selected_row = self.listbox.get_selected_row()
         selected_note_id = None
         if selected_row and hasattr(selected_row, 'note_id'):
             selected_note_id = selected_row.note_id
-        # Clear existing items
-        for child in self.listbox.get_children():
-            self.listbox.remove(child)
-        # Scan for note folders
-        note_folders = glob.glob(os.path.join(data_dir, "note*"))
+        # Reconcile the index with disk only if the data directory changed
+        try:
+            dir_mtime = os.stat(data_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is None or dir_mtime != index_dir_mtime:
+            sync_index()
+        notes = [(note_id, meta) for note_id, meta in load_index().items()
+                 if not note_id.startswith("_")]
+        if self.sort_by_name:
+            notes.sort(key=lambda n: n[1].get("title", "Untitled"))
+        else:
+            notes.sort(key=lambda n: n[1].get("mtime", 0), reverse=True)
+        default_color = DEFAULT_COLORS[0]
+        items = [NoteItem(note_id, meta.get("title", "Untitled"), meta.get("color", default_color))
+                 for note_id, meta in notes]
+        self._rows_by_id = {}
+        # Replace the model contents in one splice (one items-changed signal)
+        self.store.splice(0, self.store.get_n_items(), items)
+        for position, item in enumerate(items):
+            if item.note_id == selected_note_id:
+                self.listbox.select_row(self.listbox.get_row_at_index(position))
+        self.update_status_bar()
+    
+    def add_note_item(self, note_id):
+        """Insert a row for a newly created note at its sorted position"""
+        meta = get_note_meta(note_id)
+        item = NoteItem(note_id, meta.get("title", "Untitled"), meta.get("color", DEFAULT_COLORS[0]))
+        position = 0
         if self.sort_by_name:
-            def get_note_title(folder):
-                note_path = os.path.join(folder, "text.md")
-                if os.path.exists(note_path):
-                    try:
-                        with open(note_path, 'r') as f:
-                            first_line = f.readline().strip()
-                            return first_line if first_line else "Untitled"
-                    except:
-                        pass
-                return "Untitled"
-            note_folders.sort(key=get_note_title)
+            count = self.store.get_n_items()
+            while position < count and self.store.get_item(position).title <= item.title:
+                position += 1
+        self.store.insert(position, item)
+        self.update_status_bar()
+    
+    def remove_note_item(self, note_id):
+        """Remove the row of a deleted note"""
+        for position in range(self.store.get_n_items()):
+            if self.store.get_item(position).note_id == note_id:
+                self.store.remove(position)
+                break
+        self._rows_by_id.pop(note_id, None)
+        self.update_status_bar()
+    
+    def mark_open(self, note_id, is_open):
+        """Update one row's open/closed indicator without reloading the list"""
+        row = self._rows_by_id.get(note_id)
+        if row is None:
+            return
+        if is_open:
+            row.status_label.set_text("●")
+            row.status_label.set_tooltip_text("Currently open")
         else:
-            note_folders.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+            row.status_label.set_text("○")
+            row.status_label.set_tooltip_text(None)
+        self.update_status_bar()
+    
+    def update_status_bar(self):
+        """Show open/total note counts from the list model"""
+        total_count = self.store.get_n_items()
         open_count = 0
-        total_count = 0
-        for folder in note_folders:
-            note_id = os.path.basename(folder)
-            note_path = os.path.join(folder, "text.md")
-            if os.path.exists(note_path):
-                total_count += 1
-                try:
-                    with open(note_path, 'r') as f:
-                        first_line = f.readline().strip()
-                        title = first_line if first_line else "Untitled"
-                except:
-                    title = "Untitled"
-                # Get note color
-                color_path = os.path.join(folder, "color.txt")
-                color = DEFAULT_COLORS[0]
-                if os.path.exists(color_path):
-                    try:
-                        with open(color_path, 'r') as f:
-                            color = f.read().strip()
-                    except:
-                        pass
-                row = Gtk.ListBoxRow()
-                hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-                row.add(hbox)
-                # Color indicator
-                color_box = Gtk.DrawingArea()
-                color_box.set_size_request(20, 20)
-                color_box.connect("draw", self.draw_color_box, color)
-                hbox.pack_start(color_box, False, False, 5)
-                label = Gtk.Label(label=title, xalign=0)
-                label.set_ellipsize(Pango.EllipsizeMode.END)
-                hbox.pack_start(label, True, True, 0)
-                # Status indicator
-                status_label = Gtk.Label()
-                if note_id in open_notes:
-                    status_label.set_text("●")
-                    status_label.set_tooltip_text("Currently open")
-                    open_count += 1
-                else:
-                    status_label.set_text("○")
-                hbox.pack_start(status_label, False, False, 0)
-                row.note_id = note_id
-                self.listbox.add(row)
-                if note_id == selected_note_id:
-                    self.listbox.select_row(row)
-        # Update status bar
+        for position in range(total_count):
+            if self.store.get_item(position).note_id in open_notes:
+                open_count += 1
         self.status_bar.pop(self.status_context)
         self.status_bar.push(self.status_context, f"{open_count} open, {total_count} total notes")
-        self.listbox.show_all()
     
-    def draw_color_box(self, widget, cr, color):
-        rgba = Gdk.RGBA()
-        rgba.parse(color)
-        cr.set_source_rgba(rgba.red, rgba.green, rgba.blue, rgba.alpha)
-        cr.arc(10, 10, 8, 0, 2 * 3.14159)
-        cr.fill()
+    def _create_row(self, item):
+        """Build the list row widget for a NoteItem"""
+        note_id = item.note_id
+        row = Gtk.ListBoxRow()
+        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        row.add(hbox)
+        # Color indicator (shared pre-rendered surface, no per-expose drawing)
+        color_box = Gtk.Image.new_from_surface(self.get_color_surface(item.color))
+        hbox.pack_start(color_box, False, False, 5)
+        label = Gtk.Label(label=item.title, xalign=0)
+        label.set_ellipsize(_ELLIPSIZE_END)
+        hbox.pack_start(label, True, True, 0)
+        # Status indicator
+        status_label = Gtk.Label()
+        if note_id in open_notes:
+            status_label.set_text("●")
+            status_label.set_tooltip_text("Currently open")
+        else:
+            status_label.set_text("○")
+        hbox.pack_start(status_label, False, False, 0)
+        row.note_id = note_id
+        row.status_label = status_label
+        self._rows_by_id[note_id] = row
+        row.show_all()
+        return row
+    
+    def get_color_surface(self, color):
+        """Return the indicator circle for a color, rendering it once per scale"""
+        scale = self.get_scale_factor()
+        surface = _CIRCLE_SURFACE_CACHE.get((color, scale))
+        if surface is None:
+            surface = self.render_color_circle(color, scale)
+            _CIRCLE_SURFACE_CACHE[(color, scale)] = surface
+        return surface
+    
+    def render_color_circle(self, color, scale):
+        """Draw the 20x20 color indicator into an image surface"""
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 20 * scale, 20 * scale)
+        surface.set_device_scale(scale, scale)
+        cr = cairo.Context(surface)
+        cr.arc(10, 10, 8, 0, _TAU)
+        cr.set_source_rgba(*parse_rgba(color))
+        cr.fill_preserve()
         # Add a subtle border to make very light colors visible
         cr.set_source_rgba(0.8, 0.8, 0.8, 0.5)
         cr.set_line_width(1)
-        cr.arc(10, 10, 8, 0, 2 * 3.14159)
         cr.stroke()
+        return surface
     
     def on_row_activated(self, listbox, row):
         if hasattr(row, 'note_id'):
@@ -514,20 +949,7 @@ class TableParser:
     @staticmethod
     def is_separator_line(line):
         """Check if a line is a table separator (header divider)"""
-        stripped = line.strip()
-        if not TableParser.is_table_line(line):
-            return False
-        # Remove outer pipes and split
-        content = stripped[1:-1]
-        cells = content.split('|')
-        # Check if all cells contain only dashes, spaces, and colons
-        for cell in cells:
-            cell = cell.strip()
-            if not cell:
-                continue
-            if not re.match(r'^:?-+:?$', cell):
-                return False
-        return True
+        return _SEP_LINE_RE.match(line.strip()) is not None
     
     @staticmethod
     def parse_table_cells(line):
@@ -561,29 +983,41 @@ class TableParser:
         if not text:
             return 0
         # Remove markdown formatting for width calculation only
-        clean = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        clean = re.sub(r'\*([^*]+)\*', r'\1', clean)
-        width = 0
-        for char in clean:
-            # Get Unicode category
-            category = unicodedata.category(char)
-            # Emoji and symbols usually take more space
-            if category.startswith('So'):  # Other symbols (including emojis)
-                width += 2  # Emojis typically take 2 character widths
-            elif category.startswith('Sm'):  # Math symbols
-                width += 1.5  # Math symbols slightly wider
-            elif category.startswith('Sc'):  # Currency symbols
-                width += 1.5
-            elif unicodedata.east_asian_width(char) in ('F', 'W'):  # Full-width or Wide
-                width += 2
-            else:
-                width += 1
-        return int(width)
+        clean = _BOLD_RE.sub(r'\1', text)
+        clean = _ITAL_RE.sub(r'\1', clean)
+        # Sum per-character widths from the lookup table (C-level map + sum)
+        widths = _CHAR_HALF_WIDTHS
+        try:
+            half_width = sum(map(widths.__getitem__, clean))
+        except KeyError:
+            for char in set(clean):
+                if char not in widths:
+                    widths[char] = TableParser.char_half_width(char)
+            half_width = sum(map(widths.__getitem__, clean))
+        return half_width // 2
     
     @staticmethod
-    def pad_text(text, width, align='left'):
+    def char_half_width(char):
+        """Display width of a single character, in half columns"""
+        # Get Unicode category
+        category = unicodedata.category(char)
+        # Emoji and symbols usually take more space
+        if category.startswith('So'):  # Other symbols (including emojis)
+            return 4  # Emojis typically take 2 character widths
+        elif category.startswith('Sm'):  # Math symbols
+            return 3  # Math symbols slightly wider
+        elif category.startswith('Sc'):  # Currency symbols
+            return 3
+        elif unicodedata.east_asian_width(char) in ('F', 'W'):  # Full-width or Wide
+            return 4
+        else:
+            return 2
+    
+    @staticmethod
+    def pad_text(text, width, align='left', current_width=None):
         """Pad text to specified width while preserving original content"""
-        current_width = TableParser.estimate_display_width(text)
+        if current_width is None:
+            current_width = TableParser.estimate_display_width(text)
         padding_needed = max(0, width - current_width)
         if align == 'center':
             left_pad = padding_needed // 2
@@ -627,53 +1061,35 @@ class TableParser:
         for row in data_rows:
             while len(row) < max_cols:
                 row.append("")
-        # Calculate column widths using estimated display width
+        # Measure every cell once; the padding below reuses these widths
         all_rows = [header_cells] + data_rows
-        col_widths = []
-        for col_idx in range(max_cols):
-            max_width = 0
-            for row in all_rows:
-                if col_idx < len(row):
-                    estimated_width = TableParser.estimate_display_width(row[col_idx])
-                    max_width = max(max_width, estimated_width)
-            col_widths.append(max(max_width, 3))  # Minimum width of 3
-        # Format the table
-        result = []
-        # Top border
-        border_parts = []
-        for width in col_widths:
-            border_parts.append('─' * (width + 2))
-        result.append('┌' + '┬'.join(border_parts) + '┐')
-        # Header row
-        header_parts = []
-        for i, (cell, width, align) in enumerate(zip(header_cells, col_widths, alignments)):
-            formatted_cell = TableParser.pad_text(cell, width, align)
-            header_parts.append(f' {formatted_cell} ')
-        result.append('│' + '│'.join(header_parts) + '│')
-        # Header separator
-        sep_parts = []
-        for width in col_widths:
-            sep_parts.append('─' * (width + 2))
-        result.append('├' + '┼'.join(sep_parts) + '┤')
-        # Data rows
-        for row in data_rows:
-            row_parts = []
-            for i, width in enumerate(col_widths):
-                cell = row[i] if i < len(row) else ""
-                align = alignments[i] if i < len(alignments) else 'left'
-                formatted_cell = TableParser.pad_text(cell, width, align)
-                row_parts.append(f' {formatted_cell} ')
-            result.append('│' + '│'.join(row_parts) + '│')
-        # Bottom border
-        border_parts = []
-        for width in col_widths:
-            border_parts.append('─' * (width + 2))
-        result.append('└' + '┴'.join(border_parts) + '┘')
+        estimate = TableParser.estimate_display_width
+        cell_widths = [[estimate(cell) for cell in row] for row in all_rows]
+        # Calculate column widths (minimum width of 3)
+        col_widths = [max(3, max(row_widths[col_idx] for row_widths in cell_widths))
+                      for col_idx in range(max_cols)]
+        # Format the table: top border, header, separator, data rows, bottom border
+        result = [None] * (len(all_rows) + 3)
+        # Borders only depend on the column widths
+        rules = ['─' * (width + 2) for width in col_widths]
+        result[0] = '┌' + '┬'.join(rules) + '┐'
+        result[2] = '├' + '┼'.join(rules) + '┤'
+        result[-1] = '└' + '┴'.join(rules) + '┘'
+        pad = TableParser.pad_text
+        for row_idx, (row, row_widths) in enumerate(zip(all_rows, cell_widths)):
+            parts = [' ' + pad(cell, width, align, cell_width) + ' '
+                     for cell, cell_width, width, align
+                     in zip(row, row_widths, col_widths, alignments)]
+            # Header goes on line 1, data rows start after the separator
+            result[1 if row_idx == 0 else row_idx + 2] = '│' + '│'.join(parts) + '│'
         return '\n'.join(result)
 
 class StickyNote(Gtk.Window):
-    def __init__(self, note_id):
+    def __init__(self, note_id, meta=None):
         self.note_id = note_id
+        # Paths used on every load/save, built once per window
+        self.note_dir = os.path.join(data_dir, note_id)
+        self.text_path = self.note_dir + os.sep + "text.md"
         self.zoom_level = 1.0  # Initialize zoom level
         super().__init__()
         self.set_default_size(400, 300)
@@ -684,21 +1100,57 @@ class StickyNote(Gtk.Window):
         # Hide from taskbar and alt-tab
         self.set_skip_taskbar_hint(True)
         self.set_skip_pager_hint(True)
-        # Timeout tracking
+        # Timeout tracking (one timer drives both preview refresh and autosave)
         self.timeout_id = None
+        # Pending coalesced window dimension and zoom level saves
+        self._dim_save_pending = None
+        self._zoom_save_pending = None
+        self._saved_zoom = None
+        self._dirty_since = None
         self.is_edit_mode = False
+        # Preview is rebuilt lazily when it is out of date and shown;
+        # its text tags are created on the first render
+        self._preview_dirty = True
+        self._tags_ready = False
+        # Monotonic time of the last preview render (for the 300 ms debounce)
+        self._preview_rendered_at = 0.0
+        # Source blocks and their rendered (text, tag ranges) from the last
+        # render, so an edit only re-renders the blocks that changed
+        self._preview_blocks = None
+        self._preview_rendered = None
+        # Empty buffer swapped into the preview view during full rebuilds
+        self._preview_placeholder = None
+        # Buffer text cache, invalidated by a counter bumped on every edit
+        self._text_serial = 0
+        self._cached_text = None
+        self._cached_text_serial = -1
+        # Save bookkeeping: note folder known to exist, text last written
+        self._dir_ensured = False
+        self._last_saved_text = None
+        # CSS providers currently attached to the text views
+        self._color_provider = None
+        self._font_provider = None
+        # Current background color, so re-picking the same color is a no-op
+        self._bg_color = DEFAULT_COLORS[0]
         # Setup UI
         self.setup_ui()
+        # Editor changes drive the title, preview and autosave; load_content
+        # blocks this handler while it fills the buffer from disk
+        self._changed_handler_id = self.text_buffer.connect("changed", self.on_text_changed)
         # Load saved window dimensions
-        self.load_window_dimensions()
+        # Index entry for the initial loads (preloaded for session restore)
+        if meta is None:
+            meta = get_note_meta(note_id)
+        self.load_window_dimensions(meta)
         # Load content, color, and zoom
-        self.load_content()
-        self.load_zoom_level()
+        self.load_content(meta)
+        self.load_zoom_level(meta)
         # Connect signals
         self.connect("delete-event", self.on_close)
         self.connect("key-press-event", self.on_key_press)  # Add keyboard shortcuts
         self.connect("configure-event", self.on_configure_event)  # Save window size/position
-        self.text_buffer.connect("changed", self.on_text_changed)
+        self.notebook.connect("switch-page", self._on_switch_page)
+        self.connect("map", self._on_map)
         # Add to global windows list
         global windows, open_notes
         windows.append(self)
@@ -706,49 +1158,52 @@ class StickyNote(Gtk.Window):
         self.connect("destroy", self.on_note_destroy)
     
     def on_configure_event(self, widget, event):
-        """Save window dimensions when moved or resized"""
-        self.save_window_dimensions()
+        """Save window dimensions when moved or resized (at most every 250 ms)"""
+        if self._dim_save_pending is None:
+            self._dim_save_pending = GLib.timeout_add(250, self._flush_dimensions)
         return False
     
-    def get_dimensions_path(self):
-        return os.path.join(data_dir, self.note_id, "dimensions.json")
+    def _flush_dimensions(self):
+        self._dim_save_pending = None
+        self.save_window_dimensions()
+        return GLib.SOURCE_REMOVE
+    
+    def flush_window_dimensions(self):
+        """Cancel a pending dimension save and write the current geometry now"""
+        if self._dim_save_pending is not None:
+            GLib.source_remove(self._dim_save_pending)
+            self._dim_save_pending = None
+        self.save_window_dimensions()
     
     def save_window_dimensions(self):
         """Save current window position and size"""
         pos = self.get_position()
         size = self.get_size()
-        dimensions = {
-            "x": pos.root_x,
-            "y": pos.root_y,
-            "width": size.width,
-            "height": size.height
-        }
-        dimensions_path = self.get_dimensions_path()
+        update_note_meta(self.note_id, x=pos.root_x, y=pos.root_y,
+                         width=size.width, height=size.height)
+    
+    def load_window_dimensions(self, dimensions=None):
+        """Load and apply saved window dimensions"""
+        if dimensions is None:
+            dimensions = get_note_meta(self.note_id)
         try:
-            with open(dimensions_path, 'w') as f:
-                json.dump(dimensions, f)
+            # Apply position
+            if "x" in dimensions and "y" in dimensions:
+                self.move(dimensions["x"], dimensions["y"])
+            # Apply size
+            if "width" in dimensions and "height" in dimensions:
+                self.resize(dimensions["width"], dimensions["height"])
         except:
             pass
     
-    def load_window_dimensions(self):
-        """Load and apply saved window dimensions"""
-        dimensions_path = self.get_dimensions_path()
-        if os.path.exists(dimensions_path):
-            try:
-                with open(dimensions_path, 'r') as f:
-                    dimensions = json.load(f)
-                # Apply position
-                if "x" in dimensions and "y" in dimensions:
-                    self.move(dimensions["x"], dimensions["y"])
-                # Apply size
-                if "width" in dimensions and "height" in dimensions:
-                    self.resize(dimensions["width"], dimensions["height"])
-            except:
-                pass
-    
     def on_note_destroy(self, widget):
         if self.timeout_id is not None:
             GLib.source_remove(self.timeout_id)
+            self.timeout_id = None
+        if self._dim_save_pending is not None:
+            self.flush_window_dimensions()
+        if self._zoom_save_pending is not None:
+            self.flush_zoom_level()
         on_window_destroy(widget)
     
     def setup_ui(self):
@@ -763,7 +1218,7 @@ class StickyNote(Gtk.Window):
         # Zoom out button
         zoom_out_btn = Gtk.Button()
         zoom_out_icon = get_available_icon(ZOOM_OUT_ICONS)
-        zoom_out_btn.add(Gtk.Image.new_from_icon_name(zoom_out_icon, Gtk.IconSize.BUTTON))
+        zoom_out_btn.add(Gtk.Image.new_from_icon_name(zoom_out_icon, _ICON_SIZE_BUTTON))
         zoom_out_btn.set_tooltip_text("Zoom Out (Ctrl+-)")
         zoom_out_btn.connect("clicked", self.zoom_out)
         zoom_box.pack_start(zoom_out_btn, False, False, 0)
@@ -775,7 +1230,7 @@ class StickyNote(Gtk.Window):
         # Zoom in button  
         zoom_in_btn = Gtk.Button()
         zoom_in_icon = get_available_icon(ZOOM_IN_ICONS)
-        zoom_in_btn.add(Gtk.Image.new_from_icon_name(zoom_in_icon, Gtk.IconSize.BUTTON))
+        zoom_in_btn.add(Gtk.Image.new_from_icon_name(zoom_in_icon, _ICON_SIZE_BUTTON))
         zoom_in_btn.set_tooltip_text("Zoom In (Ctrl++)")
         zoom_in_btn.connect("clicked", self.zoom_in)
         zoom_box.pack_start(zoom_in_btn, False, False, 0)
@@ -785,42 +1240,15 @@ class StickyNote(Gtk.Window):
         reset_zoom_btn.connect("clicked", self.reset_zoom)
         zoom_box.pack_start(reset_zoom_btn, False, False, 0)
         # Menu button
-        menu_button = Gtk.MenuButton()
+        # (a plain button: a Gtk.MenuButton stays insensitive until it has a popup)
+        menu_button = Gtk.Button()
         menu_icon = get_available_icon(MENU_ICON_NAMES)
-        menu_button.add(Gtk.Image.new_from_icon_name(menu_icon, Gtk.IconSize.BUTTON))
+        menu_button.add(Gtk.Image.new_from_icon_name(menu_icon, _ICON_SIZE_BUTTON))
         header.pack_end(menu_button)
-        # Menu
-        menu = Gtk.Menu()
-        menu_button.set_popup(menu)
-        # Edit/Preview toggle
-        self.edit_item = Gtk.MenuItem(label="Edit")
-        self.edit_item.connect("activate", self.toggle_edit_mode)
-        menu.append(self.edit_item)
-        # Show manager
-        manager_item = Gtk.MenuItem(label="Show All Notes")
-        manager_item.connect("activate", lambda x: show_manager())
-        menu.append(manager_item)
-        # Change color
-        color_item = Gtk.MenuItem(label="Change Color")
-        color_item.connect("activate", self.change_color)
-        menu.append(color_item)
-        # New note
-        new_item = Gtk.MenuItem(label="New Note")
-        new_item.connect("activate", lambda x: create_new_note())
-        menu.append(new_item)
-        # Separator
-        menu.append(Gtk.SeparatorMenuItem())
-        # Delete note
-        delete_item = Gtk.MenuItem(label="Delete This Note")
-        delete_item.connect("activate", self.confirm_delete)
-        menu.append(delete_item)
-        # Separator
-        menu.append(Gtk.SeparatorMenuItem())
-        # Close
-        close_item = Gtk.MenuItem(label="Close")
-        close_item.connect("activate", self.on_close_menu)
-        menu.append(close_item)
-        menu.show_all()
+        # Menu (built on first open)
+        self.menu = None
+        self.edit_item = None
+        menu_button.connect("clicked", self.on_menu_button_clicked)
         # Content area - notebook for switching between preview and edit
         self.notebook = Gtk.Notebook()
         self.notebook.set_show_tabs(False)
@@ -847,8 +1275,6 @@ class StickyNote(Gtk.Window):
         self.notebook.append_page(edit_scroll, Gtk.Label(label="Edit"))
         # Start in preview mode
         self.notebook.set_current_page(0)
-        # Configure tags for formatting
-        self.setup_text_tags()
     
     def on_close_menu(self, widget):
         """Handle close menu item click"""
@@ -856,75 +1282,58 @@ class StickyNote(Gtk.Window):
     
     def on_key_press(self, widget, event):
         """Handle keyboard shortcuts for zoom"""
-        # Check for Ctrl key
-        if event.state & Gdk.ModifierType.CONTROL_MASK:
-            if event.keyval == Gdk.KEY_plus or event.keyval == Gdk.KEY_equal:
-                self.zoom_in(None)
-                return True
-            elif event.keyval == Gdk.KEY_minus:
-                self.zoom_out(None)
-                return True
-            elif event.keyval == Gdk.KEY_0:
-                self.reset_zoom(None)
-                return True
-        return False
+        # Most keystrokes carry no Ctrl and return straight away
+        if not event.state & _CONTROL_MASK:
+            return False
+        handler = _ZOOM_KEYS.get(event.keyval)
+        if handler is None:
+            return False
+        getattr(self, handler)(None)
+        return True
     
     def zoom_in(self, button):
         """Increase zoom level"""
-        if self.zoom_level < 3.0:  # Max 300%
-            self.zoom_level += 0.1
-            self.apply_zoom()
-            self.save_zoom_level()
+        self.set_zoom_level(min(3.0, round(self.zoom_level + 0.1, 2)))  # Max 300%
     
     def zoom_out(self, button):
         """Decrease zoom level"""
-        if self.zoom_level > 0.5:  # Min 50%
-            self.zoom_level -= 0.1
-            self.apply_zoom()
-            self.save_zoom_level()
+        self.set_zoom_level(max(0.5, round(self.zoom_level - 0.1, 2)))  # Min 50%
     
     def reset_zoom(self, button):
         """Reset zoom to 100%"""
-        self.zoom_level = 1.0
+        self.set_zoom_level(1.0)
+    
+    def set_zoom_level(self, zoom_level):
+        """Apply and save a new zoom level; steps past the limits do nothing"""
+        if zoom_level == self.zoom_level:
+            return
+        self.zoom_level = zoom_level
         self.apply_zoom()
         self.save_zoom_level()
     
     def apply_zoom(self):
         """Apply current zoom level to text views"""
         # Update zoom label
-        self.zoom_label.set_text(f"{int(self.zoom_level * 100)}%")
-        # Create CSS for font size and background color
-        # Get current background color
-        color_path = self.get_color_path()
-        bg_color = DEFAULT_COLORS[0]
-        if os.path.exists(color_path):
-            try:
-                with open(color_path, 'r') as f:
-                    bg_color = f.read().strip()
-            except:
-                pass
-        css = f"""
-        textview {{
-            font-size: {12 * self.zoom_level}pt;
-            background-color: {bg_color};
-        }}
-        textview text {{
-            background-color: {bg_color};
-        }}
-        """.encode('utf-8')
-        style_provider = Gtk.CssProvider()
-        style_provider.load_from_data(css)
-        # Apply to both text views
-        Gtk.StyleContext.add_provider(
-            self.text_view.get_style_context(),
-            style_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
-        )
-        Gtk.StyleContext.add_provider(
-            self.preview_view.get_style_context(),
-            style_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
-        )
+        self.zoom_label.set_text(f"{round(self.zoom_level * 100)}%")
+        # Font size has its own provider, so zooming never touches the color
+        zoom_level = round(self.zoom_level, 2)
+        style_provider = _FONT_CSS_CACHE.get(zoom_level)
+        if style_provider is None:
+            css = f"textview {{ font-size: {round(12 * zoom_level, 2)}pt; }}".encode('utf-8')
+            style_provider = Gtk.CssProvider()
+            style_provider.load_from_data(css)
+            _FONT_CSS_CACHE[zoom_level] = style_provider
+        self._font_provider = self.swap_view_provider(self._font_provider, style_provider)
+    
+    def swap_view_provider(self, old_provider, style_provider):
+        """Attach a provider to both text views in place of old_provider and return it"""
+        if style_provider is not old_provider:
+            for view in (self.text_view, self.preview_view):
+                context = view.get_style_context()
+                if old_provider is not None:
+                    context.remove_provider(old_provider)
+                context.add_provider(style_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1)
+        return style_provider
     
     def setup_text_tags(self):
         tag_table = self.preview_buffer.get_tag_table()
@@ -947,146 +1356,246 @@ class StickyNote(Gtk.Window):
         tag_table.add(self.monospace_tag)
     
     def get_note_path(self):
-        return os.path.join(data_dir, self.note_id, "text.md")
+        return self.text_path
     
-    def get_color_path(self):
-        return os.path.join(data_dir, self.note_id, "color.txt")
+    def save_zoom_level(self):
+        """Save zoom level once zoom steps pause for 750 ms"""
+        if self._zoom_save_pending is not None:
+            GLib.source_remove(self._zoom_save_pending)
+        self._zoom_save_pending = GLib.timeout_add(750, self._on_zoom_save_timer)
+    
+    def _on_zoom_save_timer(self):
+        self._zoom_save_pending = None
+        self.write_zoom_level()
+        return False
     
-    def get_zoom_path(self):
-        return os.path.join(data_dir, self.note_id, "zoom.txt")
+    def write_zoom_level(self):
+        """Store the zoom level in the index unless it is already stored"""
+        if self.zoom_level != self._saved_zoom:
+            update_note_meta(self.note_id, zoom=self.zoom_level)
+            self._saved_zoom = self.zoom_level
     
-    def save_zoom_level(self):
-        """Save zoom level to file"""
-        zoom_path = self.get_zoom_path()
+    def flush_zoom_level(self):
+        """Cancel a pending zoom save and write the zoom level now"""
+        if self._zoom_save_pending is not None:
+            GLib.source_remove(self._zoom_save_pending)
+            self._zoom_save_pending = None
+        self.write_zoom_level()
+    
+    def load_zoom_level(self, meta=None):
+        """Load zoom level from the index"""
+        if meta is None:
+            meta = get_note_meta(self.note_id)
+        # Zoom level as stored in the index, to skip writing it back unchanged
+        self._saved_zoom = meta.get("zoom")
         try:
-            with open(zoom_path, 'w') as f:
-                f.write(str(self.zoom_level))
+            self.zoom_level = float(meta.get("zoom", 1.0))
+            # Ensure zoom level is within bounds
+            self.zoom_level = max(0.5, min(3.0, self.zoom_level))
         except:
-            pass
-    
-    def load_zoom_level(self):
-        """Load zoom level from file"""
-        zoom_path = self.get_zoom_path()
-        if os.path.exists(zoom_path):
-            try:
-                with open(zoom_path, 'r') as f:
-                    self.zoom_level = float(f.read().strip())
-                # Ensure zoom level is within bounds
-                self.zoom_level = max(0.5, min(3.0, self.zoom_level))
-            except:
-                self.zoom_level = 1.0
-        else:
             self.zoom_level = 1.0
         self.apply_zoom()
     
-    def load_content(self):
-        note_path = self.get_note_path()
-        color_path = self.get_color_path()
-        # Load color
-        color = DEFAULT_COLORS[0]
-        if os.path.exists(color_path):
-            try:
-                with open(color_path, 'r') as f:
-                    color = f.read().strip()
-            except:
-                pass
-        # Apply color using CSS (will be combined with zoom in apply_zoom)
+    def load_content(self, meta=None):
+        note_path = self.text_path
+        if meta is None:
+            meta = get_note_meta(self.note_id)
+        # Load color and apply it using CSS
+        color = meta.get("color", DEFAULT_COLORS[0])
         self.apply_color_css(color)
         # Load content
-        if os.path.exists(note_path):
-            try:
-                with open(note_path, 'r') as f:
-                    content = f.read()
-                self.text_buffer.set_text(content)
-                self.update_preview()
-                # Set window title from first line
-                lines = content.splitlines()
-                title = lines[0] if lines and lines[0].strip() else "Untitled"
-                self.set_title(title)
-            except:
-                self.text_buffer.set_text("Error loading note")
-                self.set_title("Error")
+        try:
+            content = _read_text(note_path)
+        except FileNotFoundError:
+            return
+        except:
+            self.set_buffer_text_quietly("Error loading note")
+            self.set_title("Error")
+            return
+        self._last_saved_text = content
+        self._dir_ensured = True
+        self.set_buffer_text_quietly(content)
+        # Preview is rendered once the window is shown (see _on_map)
+        # Set window title from first line
+        first_line = content.split('\n', 1)[0]
+        self.set_title(first_line if first_line.strip() else "Untitled")
+    
+    def set_buffer_text_quietly(self, text):
+        """Replace the editor text without running on_text_changed (no autosave)"""
+        self.text_buffer.handler_block(self._changed_handler_id)
+        self.text_buffer.set_text(text)
+        self.text_buffer.handler_unblock(self._changed_handler_id)
+        # The text cache and preview still need to see the new text
+        self._text_serial += 1
+        self._preview_dirty = True
     
     def apply_color_css(self, color):
-        # This will be overridden by apply_zoom which combines color and font size
-        pass
+        """Apply the background color to both text views"""
+        self._bg_color = color
+        style_provider = _COLOR_CSS_CACHE.get(color)
+        if style_provider is None:
+            css = f"""
+            textview {{
+                background-color: {color};
+            }}
+            textview text {{
+                background-color: {color};
+            }}
+            """.encode('utf-8')
+            style_provider = Gtk.CssProvider()
+            style_provider.load_from_data(css)
+            _COLOR_CSS_CACHE[color] = style_provider
+        self._color_provider = self.swap_view_provider(self._color_provider, style_provider)
+    
+    def get_buffer_text(self):
+        """Return the editor text, extracting it from the buffer only after edits"""
+        if self._cached_text_serial != self._text_serial:
+            start_iter = self.text_buffer.get_start_iter()
+            end_iter = self.text_buffer.get_end_iter()
+            self._cached_text = self.text_buffer.get_text(start_iter, end_iter, True)
+            self._cached_text_serial = self._text_serial
+        return self._cached_text
     
     def update_preview(self):
+        # Configure tags for formatting on first use
+        if not self._tags_ready:
+            self.setup_text_tags()
+            self._tags_ready = True
         # Get text from editor
-        start_iter = self.text_buffer.get_start_iter()
-        end_iter = self.text_buffer.get_end_iter()
-        text = self.text_buffer.get_text(start_iter, end_iter, True)
-        # Clear preview
-        self.preview_buffer.set_text("")
-        # Skip first two lines (title + empty line)
-        lines = text.split('\n')
-        preview_lines = lines[2:] if len(lines) > 2 else []
-        # Enhanced markdown parsing with table support
-        i = 0
-        while i < len(preview_lines):
-            line = preview_lines[i]
-            # Check for table
-            if TableParser.is_table_line(line):
-                # Collect all table lines
-                table_lines = [line]
+        text = self.get_buffer_text()
+        # Skip first two lines (title + empty line) by index, without a sliced copy
+        blocks = self.split_preview_blocks(text.split('\n'), 2)
+        old_blocks = self._preview_blocks
+        buf = self.preview_buffer
+        if old_blocks is not None:
+            # Find the changed run of blocks by walking in from both ends
+            old_count = len(old_blocks)
+            new_count = len(blocks)
+            shorter = min(old_count, new_count)
+            prefix = 0
+            while prefix < shorter and old_blocks[prefix] == blocks[prefix]:
+                prefix += 1
+            suffix = 0
+            while suffix < shorter - prefix and old_blocks[old_count - 1 - suffix] == blocks[new_count - 1 - suffix]:
+                suffix += 1
+            changed = blocks[prefix:new_count - suffix]
+            # Patch only the changed blocks unless most of the document changed
+            if len(changed) <= 0.8 * new_count:
+                old_rendered = self._preview_rendered
+                rendered = [self.render_preview_block(block) for block in changed]
+                start_offset = sum(len(chunk) for chunk, ranges in old_rendered[:prefix])
+                old_length = sum(len(chunk) for chunk, ranges in old_rendered[prefix:old_count - suffix])
+                new_text = ''.join(chunk for chunk, ranges in rendered)
+                buf.begin_user_action()
+                buf.delete(buf.get_iter_at_offset(start_offset),
+                           buf.get_iter_at_offset(start_offset + old_length))
+                if new_text:
+                    buf.insert(buf.get_iter_at_offset(start_offset), new_text)
+                    # Inserted text can pick up a neighbouring block's tags
+                    buf.remove_all_tags(buf.get_iter_at_offset(start_offset),
+                                        buf.get_iter_at_offset(start_offset + len(new_text)))
+                    self.apply_preview_tags(rendered, start_offset)
+                buf.end_user_action()
+                self._preview_blocks = blocks
+                self._preview_rendered = old_rendered[:prefix] + rendered + old_rendered[old_count - suffix:]
+                self._preview_dirty = False
+                self._preview_rendered_at = time.monotonic()
+                return
+        # Full rebuild: fill the buffer once, then apply tags in a single pass.
+        # The view shows an empty placeholder meanwhile so it lays out once
+        # at the end rather than after every tag application
+        rendered = [self.render_preview_block(block) for block in blocks]
+        if self._preview_placeholder is None:
+            self._preview_placeholder = Gtk.TextBuffer()
+        self.preview_view.set_buffer(self._preview_placeholder)
+        buf.begin_user_action()
+        buf.set_text(''.join(chunk for chunk, ranges in rendered))
+        self.apply_preview_tags(rendered, 0)
+        buf.end_user_action()
+        self.preview_view.set_buffer(buf)
+        self._preview_blocks = blocks
+        self._preview_rendered = rendered
+        self._preview_dirty = False
+        self._preview_rendered_at = time.monotonic()
+    
+    @staticmethod
+    def split_preview_blocks(lines, start=0):
+        """Group lines from start on into blocks: each table run, or a single other line"""
+        line_match = _LINE_RE.match
+        blocks = []
+        line_count = len(lines)
+        i = start
+        while i < line_count:
+            m = line_match(lines[i])
+            if m is not None and m.lastgroup == "table":
                 j = i + 1
-                while j < len(preview_lines) and TableParser.is_table_line(preview_lines[j]):
-                    table_lines.append(preview_lines[j])
+                while j < line_count:
+                    m = line_match(lines[j])
+                    if m is None or m.lastgroup != "table":
+                        break
                     j += 1
-                # Format and insert table
-                if len(table_lines) >= 2:  # At least header + one row
-                    formatted_table = TableParser.format_table(table_lines)
-                    if formatted_table:
-                        start = self.preview_buffer.get_end_iter()
-                        self.preview_buffer.insert_with_tags(start, formatted_table + "\n\n", 
-                                                             self.monospace_tag)
+                blocks.append(tuple(lines[i:j]))
                 i = j
-                continue
-            # Regular markdown parsing
-            start = self.preview_buffer.get_end_iter()
-            # Headers
-            if line.startswith("# "):
-                self.preview_buffer.insert_with_tags(start, line[2:] + "\n", self.header_tag)
-            elif line.startswith("## "):
-                self.preview_buffer.insert_with_tags(start, line[3:] + "\n", self.header_tag)
-            # Bold and italic (simple parsing)
-            elif "**" in line or "*" in line:
-                self.parse_inline_formatting(line)
             else:
-                self.preview_buffer.insert(start, line + "\n")
-            i += 1
+                blocks.append((lines[i],))
+                i += 1
+        return blocks
+    
+    def render_preview_block(self, block):
+        """Render one preview block to (text, [(tag, start, end)]) with block-relative offsets"""
+        line = block[0]
+        m = _LINE_RE.match(line)
+        kind = m.lastgroup if m is not None else None
+        # Table: at least header + one row
+        if kind == "table":
+            if len(block) >= 2:
+                formatted_table = TableParser.format_table(list(block))
+                if formatted_table:
+                    chunk = formatted_table + "\n\n"
+                    return chunk, [(self.monospace_tag, 0, len(chunk))]
+            return "", []
+        # Headers
+        if kind == "header":
+            chunk = m.group("header") + "\n"
+            return chunk, [(self.header_tag, 0, len(chunk))]
+        # Bold and italic (simple parsing)
+        if "*" in line:
+            text_parts = []
+            tag_ranges = []
+            self.parse_inline_formatting(line, text_parts, tag_ranges, 0)
+            return ''.join(text_parts), tag_ranges
+        return line + "\n", []
     
-    def parse_inline_formatting(self, line):
-        # Simple bold/italic parsing
+    def apply_preview_tags(self, rendered, offset):
+        """Apply the tag ranges of rendered blocks placed in the buffer from offset on"""
+        buf = self.preview_buffer
+        get_iter = buf.get_iter_at_offset
+        for chunk, ranges in rendered:
+            for tag, start, end in ranges:
+                buf.apply_tag(tag, get_iter(offset + start), get_iter(offset + end))
+            offset += len(chunk)
+    
+    def parse_inline_formatting(self, line, text_parts, tag_ranges, offset):
+        """Append a line with bold/italic spans to the accumulators, return the new offset"""
+        # One segment per plain run or emphasis span; a line with a stray '*'
+        # and no span comes out as a single plain segment
+        append = text_parts.append
         pos = 0
-        start = self.preview_buffer.get_end_iter()
-        while pos < len(line):
-            if line.startswith("**", pos):
-                end_pos = line.find("**", pos+2)
-                if end_pos != -1:
-                    self.preview_buffer.insert(start, line[pos+2:end_pos])
-                    start = self.preview_buffer.get_end_iter()
-                    self.apply_tag_to_last(self.bold_tag, len(line[pos+2:end_pos]))
-                    pos = end_pos + 2
-                    continue
-            if line.startswith("*", pos) and not line.startswith("**", pos):
-                end_pos = line.find("*", pos+1)
-                if end_pos != -1:
-                    self.preview_buffer.insert(start, line[pos+1:end_pos])
-                    start = self.preview_buffer.get_end_iter()
-                    self.apply_tag_to_last(self.italic_tag, len(line[pos+1:end_pos]))
-                    pos = end_pos + 1
-                    continue
-            self.preview_buffer.insert(start, line[pos])
-            start = self.preview_buffer.get_end_iter()
-            pos += 1
-        self.preview_buffer.insert(start, "\n")
-    
-    def apply_tag_to_last(self, tag, length):
-        end_iter = self.preview_buffer.get_end_iter()
-        start_iter = end_iter.copy()
-        start_iter.backward_chars(length)
-        self.preview_buffer.apply_tag(tag, start_iter, end_iter)
+        for m in _INLINE_RE.finditer(line):
+            start = m.start()
+            # Plain text between matches
+            if start > pos:
+                append(line[pos:start])
+                offset += start - pos
+            span = m.group(m.lastindex)
+            tag = self.bold_tag if m.lastindex == 1 else self.italic_tag
+            append(span)
+            tag_ranges.append((tag, offset, offset + len(span)))
+            offset += len(span)
+            pos = m.end()
+        rest = line[pos:] + "\n"
+        append(rest)
+        return offset + len(rest)
     
     def toggle_edit_mode(self, widget):
         self.is_edit_mode = not self.is_edit_mode
@@ -1096,50 +1605,148 @@ class StickyNote(Gtk.Window):
         else:
             self.notebook.set_current_page(0)  # Preview
         self.update_edit_button()
-        # Refresh manager when toggling modes
-        refresh_manager()
+    
+    def _on_edit_timer(self):
+        """Refresh a visible stale preview after a 300ms pause, then save once edits have settled for 2s"""
+        idle_for = time.monotonic() - self._dirty_since
+        if self._preview_dirty and idle_for >= 0.3 and self.notebook.get_current_page() == 0:
+            self.update_preview()
+        if idle_for < 2.0:
+            return True
+        self.timeout_id = None
+        return self.save_content()
+    
+    def _on_map(self, widget):
+        """Render the preview when the window first appears on the Preview page"""
+        if self._preview_dirty and self.notebook.get_current_page() == 0:
+            self.update_preview()
+    
+    def _on_switch_page(self, notebook, page, page_num):
+        """Render the preview on demand when switching to it"""
+        if page_num == 0 and self._preview_dirty:
+            self.update_preview()
+    
+    def on_menu_button_clicked(self, menu_button):
+        # Right-align the menu under the button at the end of the header bar
+        self._get_menu(menu_button).popup_at_widget(
+            menu_button, Gdk.Gravity.SOUTH_EAST, Gdk.Gravity.NORTH_EAST, None)
+    
+    def _get_menu(self, menu_button):
+        """Return the note menu, building it the first time it is opened"""
+        if self.menu is None:
+            self.menu = self.build_menu()
+            self.menu.attach_to_widget(menu_button, None)
+        return self.menu
+    
+    def build_menu(self):
+        """Create the note's header menu"""
+        menu = Gtk.Menu()
+        # Edit/Preview toggle
+        self.edit_item = Gtk.MenuItem(label="Preview" if self.is_edit_mode else "Edit")
+        self.edit_item.connect("activate", self.toggle_edit_mode)
+        menu.append(self.edit_item)
+        # Show manager
+        manager_item = Gtk.MenuItem(label="Show All Notes")
+        manager_item.connect("activate", _act_show)
+        menu.append(manager_item)
+        # Change color
+        color_item = Gtk.MenuItem(label="Change Color")
+        color_item.connect("activate", self.change_color)
+        menu.append(color_item)
+        # New note
+        new_item = Gtk.MenuItem(label="New Note")
+        new_item.connect("activate", _act_new)
+        menu.append(new_item)
+        # Separator
+        menu.append(Gtk.SeparatorMenuItem())
+        # Delete note
+        delete_item = Gtk.MenuItem(label="Delete This Note")
+        delete_item.connect("activate", self.confirm_delete)
+        menu.append(delete_item)
+        # Separator
+        menu.append(Gtk.SeparatorMenuItem())
+        # Close
+        close_item = Gtk.MenuItem(label="Close")
+        close_item.connect("activate", self.on_close_menu)
+        menu.append(close_item)
+        menu.show_all()
+        return menu
     
     def update_edit_button(self):
+        # The menu item picks up the mode when the menu is built
+        if self.edit_item is None:
+            return
         if self.is_edit_mode:
             self.edit_item.set_label("Preview")
         else:
             self.edit_item.set_label("Edit")
     
     def on_text_changed(self, buffer):
-        # Update window title from first line
+        self._text_serial += 1
+        # Update window title from first line (only when it actually changed)
         start_iter = buffer.get_start_iter()
         end_iter = start_iter.copy()
         if not end_iter.ends_line():
             end_iter.forward_to_line_end()
-        first_line = buffer.get_text(start_iter, end_iter, False)
-        title = first_line or "Untitled"
-        self.set_title(title)
-        self.update_preview()
-        # Cancel any pending save
+        title = buffer.get_text(start_iter, end_iter, False) or "Untitled"
+        if title != self.get_title():
+            self.set_title(title)
+        # Preview renders only while visible; otherwise it waits for switch-page
+        now = time.monotonic()
+        self._preview_dirty = True
+        self._dirty_since = now
+        # Leading edge: the first change after a quiet spell renders right away,
+        # the rest of a burst is picked up by the timer once typing pauses
+        if now - self._preview_rendered_at >= 0.3 and self.notebook.get_current_page() == 0:
+            self.update_preview()
+        # Coalesce bursts of keystrokes onto a single pending timer
+        if self.timeout_id is None:
+            self.timeout_id = GLib.timeout_add(150, self._on_edit_timer)
+    
+    def save_content(self):
+        # A direct save supersedes any pending autosave
         if self.timeout_id is not None:
             GLib.source_remove(self.timeout_id)
-        # Schedule new save
-        self.timeout_id = GLib.timeout_add_seconds(2, self.save_content)
+            self.timeout_id = None
+        text = self.get_buffer_text()
+        # Nothing to do if the text matches what is on disk (e.g. typed then undone)
+        if text == self._last_saved_text:
+            return False
+        # Write on the save thread so slow disks never stall typing
+        future = _save_executor.submit(_write_note, self.note_dir, self.text_path,
+                                       text, not self._dir_ensured)
+        future.add_done_callback(lambda f: GLib.idle_add(self._on_note_saved, f, text))
+        self._dir_ensured = True
+        self._last_saved_text = text
+        # Keep the index title in step with the note (mtime follows once written)
+        first_line = text.split('\n', 1)[0].strip()
+        update_note_meta(self.note_id, title=first_line or "Untitled")
+        return False
     
-    def save_content(self):
-        start_iter = self.text_buffer.get_start_iter()
-        end_iter = self.text_buffer.get_end_iter()
-        text = self.text_buffer.get_text(start_iter, end_iter, True)
-        note_path = self.get_note_path()
-        os.makedirs(os.path.dirname(note_path), exist_ok=True)
+    def _on_note_saved(self, future, text):
+        """Record a finished background save (runs on the main thread)"""
         try:
-            with open(note_path, 'w') as f:
-                f.write(text)
+            mtime = future.result()
         except:
-            pass
-        self.timeout_id = None
+            # Let the next save retry the write
+            if self._last_saved_text == text:
+                self._last_saved_text = None
+            self._dir_ensured = False
+        else:
+            # The note may have been deleted while the write was in flight
+            entry = load_index().get(self.note_id)
+            if entry is not None:
+                entry["mtime"] = mtime
+                save_index()
         # Refresh manager after saving (content might have changed)
         refresh_manager()
         return False
     
     def on_close(self, window, event):
         self.save_content()
-        self.save_zoom_level()
+        # Autosaves skip fsync; make the last rename durable once on close
+        _save_executor.submit(_fsync_dir, self.note_dir)
+        self.flush_zoom_level()
         return False  # Allow destruction
     
     def confirm_delete(self, widget):
@@ -1166,33 +1773,33 @@ class StickyNote(Gtk.Window):
         if response == Gtk.ResponseType.OK:
             color = dialog.get_rgba()
             hex_color = self.rgba_to_hex(color)
-            # Save color
-            color_path = self.get_color_path()
-            try:
-                with open(color_path, 'w') as f:
-                    f.write(hex_color)
-            except:
-                pass
-            # Apply new color (this will combine with current zoom)
-            self.apply_zoom()
-            # Refresh manager when color changes
-            refresh_manager()
+            # Nothing to save or restyle if the same color was picked
+            if hex_color != self._bg_color:
+                # Save color
+                update_note_meta(self.note_id, color=hex_color)
+                # Apply new color (the font size provider is left as is)
+                self.apply_color_css(hex_color)
+                # Refresh manager when color changes
+                refresh_manager()
         dialog.destroy()
     
     def rgba_to_hex(self, rgba):
-        r = int(rgba.red * 255)
-        g = int(rgba.green * 255)
-        b = int(rgba.blue * 255)
-        return f"#{r:02x}{g:02x}{b:02x}"
+        # Round to the nearest channel value instead of truncating
+        return '#' + bytes((int(rgba.red * 255 + 0.5),
+                            int(rgba.green * 255 + 0.5),
+                            int(rgba.blue * 255 + 0.5))).hex()
 
 def open_session_notes():
     session_data = load_session()
     notes = []
+    # One scan of the data directory provides every note's settings
+    index = preload_note_meta() if session_data else None
     for entry in session_data:
         note_id = entry["note_id"]
-        note_dir = os.path.join(data_dir, note_id)
-        if os.path.exists(note_dir):
-            note = StickyNote(note_id)
+        # After the sync the index lists exactly the notes on disk
+        meta = index.get(note_id)
+        if meta is not None:
+            note = StickyNote(note_id, meta)
             # Restore position and size
             note.move(entry.get("x", 100), entry.get("y", 100))
             if "width" in entry and "height" in entry:
@@ -1206,8 +1813,11 @@ def open_session_notes():
             if "zoom_level" in entry:
                 note.zoom_level = max(0.5, min(3.0, entry["zoom_level"]))
                 note.apply_zoom()
-            note.show_all()
             notes.append(note)
+    # Show the windows only once all of them are set up, so GTK can
+    # batch their realize/map work
+    for note in notes:
+        note.show_all()
     return notes
 
 if __name__ == "__main__":
@@ -1217,14 +1827,17 @@ if __name__ == "__main__":
     session_notes = open_session_notes()
     if not session_notes:
         # No session found - check if we have any notes at all
-        note_folders = glob.glob(os.path.join(data_dir, "note*"))
-        if note_folders:
+        # (the reconciled index has every note and its text.md mtime)
+        index = preload_note_meta()
+        note_ids = [note_id for note_id in index if not note_id.startswith("_")]
+        if note_ids:
             # Open the latest note
-            note_folders.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-            note_id = os.path.basename(note_folders[0])
-            note = StickyNote(note_id)
+            latest = max(note_ids, key=lambda note_id: index[note_id].get("mtime", 0))
+            note = StickyNote(latest, index[latest])
             note.show_all()
         else:
             # No notes exist - show manager to let user create first note
             show_manager()
-    Gtk.main()
\ No newline at end of file
+    Gtk.main()
+    # Write any index update still waiting on its timer
+    flush_index()
\ No newline at end of file